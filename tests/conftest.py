@@ -0,0 +1,111 @@
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+import pytest
+from fakeredis import TcpFakeServer
+from sqlalchemy import event
+
+# app.py builds its engine, Redis client and cache at import time, so point
+# them at throwaway backends before it is imported: a temp SQLite file and an
+# in-process fake Redis server.
+_redis_server = TcpFakeServer(("127.0.0.1", 0), server_type="redis")
+threading.Thread(target=_redis_server.serve_forever, daemon=True).start()
+_redis_host, _redis_port = _redis_server.server_address
+
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(_db_dir, "test.db")
+os.environ["REDIS_URL"] = f"redis://{_redis_host}:{_redis_port}/0"
+os.environ["CACHE_REDIS_URL"] = f"redis://{_redis_host}:{_redis_port}/1"
+
+from app import app as flask_app, db, cache, redis_client, celery_app  # noqa: E402
+
+flask_app.config["TESTING"] = True
+celery_app.conf.task_always_eager = True
+
+
+@contextmanager
+def _count_queries(engine):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    with flask_app.app_context():
+        db.drop_all()
+        db.create_all()
+    cache.clear()
+    redis_client.flushall()
+    yield
+    with flask_app.app_context():
+        db.session.remove()
+
+
+@pytest.fixture
+def app():
+    return flask_app
+
+
+@pytest.fixture
+def client():
+    return flask_app.test_client()
+
+
+@pytest.fixture
+def teacher_client(client):
+    with client.session_transaction() as sess:
+        sess["user_id"] = 1
+        sess["role"] = "teacher"
+    return client
+
+
+@pytest.fixture
+def count_queries():
+    """Records the SQL statements run on the app's engine:
+
+        with count_queries() as queries:
+            client.get("/view-complaints")
+        assert len(queries) <= 2
+    """
+    with flask_app.app_context():
+        engine = db.engine
+    return lambda: _count_queries(engine)
+
+
+@pytest.fixture
+def make_student():
+    from app import Student, _hash_parent_email
+
+    def factory(roll_no, name="Student", parent_email="parent@example.com"):
+        with flask_app.app_context():
+            student = Student(roll_no=roll_no, name=name, standard="5",
+                              parent_email=parent_email,
+                              parent_email_hash=_hash_parent_email(parent_email))
+            db.session.add(student)
+            db.session.commit()
+            return student.id
+    return factory
+
+
+@pytest.fixture
+def make_complaint():
+    from app import Complaint
+
+    def factory(roll_no, title="Complaint"):
+        with flask_app.app_context():
+            complaint = Complaint(student_roll_no=roll_no, title=title,
+                                  description="Details", teacher_username="teacher")
+            db.session.add(complaint)
+            db.session.commit()
+            return complaint.id
+    return factory
@@ -0,0 +1,38 @@
+import re
+from urllib.parse import unquote
+
+LOAD_MORE = re.compile(r'href="([^"]+)">Load more</a>')
+
+
+def walk_pages(client, url, id_pattern):
+    """Follows "Load more" links from url, returning the ids seen on each page."""
+    pages = []
+    while url:
+        html = client.get(url).get_data(as_text=True)
+        pages.append([int(i) for i in re.findall(id_pattern, html)])
+        match = LOAD_MORE.search(html)
+        url = unquote(match.group(1)).replace("&amp;", "&") if match else None
+        assert len(pages) < 20, "pagination did not terminate"
+    return pages
+
+
+def test_complaint_pages_cover_every_complaint_once(teacher_client, make_student, make_complaint):
+    make_student(1)
+    # Filed within the same second, so date_filed alone cannot order them
+    complaint_ids = [make_complaint(1) for _ in range(5)]
+
+    pages = walk_pages(teacher_client, "/view-complaints?limit=2", r"<tr>\s*<td>(\d+)</td>")
+
+    seen = [i for page in pages for i in page]
+    assert seen == sorted(complaint_ids, reverse=True)
+    assert [len(page) for page in pages] == [2, 2, 1]
+
+
+def test_student_pages_cover_every_student_once(teacher_client, make_student):
+    student_ids = [make_student(roll_no, name=f"S{roll_no}") for roll_no in range(1, 6)]
+
+    pages = walk_pages(teacher_client, "/teacher-dashboard?limit=2", r"update-student/(\d+)")
+
+    seen = [i for page in pages for i in page]
+    assert seen == student_ids
+    assert [len(page) for page in pages] == [2, 2, 1]
@@ -0,0 +1,38 @@
+def test_view_complaints_query_count(teacher_client, make_student, make_complaint, count_queries):
+    for roll_no in range(1, 6):
+        make_student(roll_no)
+        make_complaint(roll_no)
+
+    with count_queries() as queries:
+        response = teacher_client.get("/view-complaints")
+
+    assert response.status_code == 200
+    assert len(queries) <= 2
+
+
+def test_view_students_query_count(teacher_client, make_student, count_queries):
+    for roll_no in range(1, 6):
+        make_student(roll_no)
+
+    with count_queries() as queries:
+        response = teacher_client.get("/teacher-dashboard")
+
+    assert response.status_code == 200
+    assert len(queries) <= 1
+
+
+def test_parent_complaints_query_count(client, make_student, make_complaint, count_queries):
+    student_id = make_student(7)
+    for _ in range(3):
+        make_complaint(7)
+    with client.session_transaction() as sess:
+        sess["parent_lookup_id"] = student_id
+        sess["role"] = "parent"
+
+    with count_queries() as queries:
+        response = client.get("/parent-complaints")
+
+    assert response.status_code == 200
+    # One for the student (cache miss) and one for the complaints
+    assert len(queries) <= 2
+